@@ -31,9 +31,14 @@ extensions = [
     'sphinx.ext.autodoc',
     'sphinx.ext.intersphinx',
     'sphinx.ext.napoleon',
-    'm2r',
+    'myst_parser',
 ]
 
+source_suffix = {
+    '.rst': 'restructuredtext',
+    '.md': 'markdown',
+}
+
 intersphinx_mapping = {
     'python': ('https://docs.python.org/3', None),
     'attrs': ('https://www.attrs.org/en/stable/', None),
@@ -27,29 +27,33 @@ from refex.python import syntactic_template
 from refex.python.matchers import syntax_matchers
 
 
+# --mode=py.expr is equivalent to PyExprRewritingSearcher paired with an
+# ExprPattern. However, you can pass any matcher, not just an ExprPattern.
+_HELLO_PATTERN = syntax_matchers.ExprPattern('hello')
+
+# The value type corresponds to the --sub-mode. While refex on the command line
+# defaults to picking the paired --sub-mode that matches the --mode, here there
+# are no defaults and you must be explicit.
+# e.g. for unsafe textual substitutions, as with --sub-mode=sh, you would use
+# formatting.ShTemplate.
+_WORLD_TEMPLATE = syntactic_template.PythonExprTemplate('world')
+
+# The searcher is immutable, so it is built once, at import time.
+_SEARCHER = search.PyExprRewritingSearcher.from_matcher(
+    _HELLO_PATTERN,
+    {
+        # Using ROOT_LABEL as a key is equivalent to --sub=world.
+        # To get the equivalent of --named-sub=x=world,
+        # it would 'x' as a key instead.
+        search.ROOT_LABEL: _WORLD_TEMPLATE,
+    },
+)
+
+
 def main():
   cli.run(
       runner=cli.RefexRunner(
-          searcher=search.PyExprRewritingSearcher.from_matcher(
-              # --mode=py.expr is equivalent to PyExprRewritingSearcher paired
-              # with an ExprPattern. However, you can pass any matcher, not just
-              # an ExprPattern.
-              syntax_matchers.ExprPattern('hello'),
-              {
-                  # Using ROOT_LABEL as a key is equivalent to --sub=world.
-                  # To get the equivalent of --named-sub=x=world,
-                  # it would 'x' as a key instead.
-                  #
-                  # The value type corresponds to the --sub-mode. While
-                  # refex on the command line defaults to picking the paired
-                  # --sub-mode that matches the --mode, here there are no
-                  # defaults and you must be explicit.
-                  # e.g. for unsafe textual substitutions, as with
-                  # --sub-mode=sh, you would use formatting.ShTemplate.
-                  search.ROOT_LABEL:
-                      syntactic_template.PythonExprTemplate('world')
-              },
-          ),
+          searcher=_SEARCHER,
           dry_run=False,
       ),
       files=sys.argv[1:],
@@ -18,53 +18,69 @@ For example, replacing SumMatcher() with "$sum" will replace
 """
 
 import ast
+import numbers
+import sys
 
 import attr
 
 from refex.python import matcher
 from refex.python.matchers import base_matchers
 
+__all__ = ['SumMatcher']
 
-@attr.s(frozen=True)
+# The name the sum is bound to, for use in templates as $sum.
+_SUM_NAME = "sum"
+
+
+@attr.s(frozen=True, slots=True)
 class SumMatcher(matcher.Matcher):
-  bind_variables = frozenset({"sum"})
+  bind_variables = frozenset({_SUM_NAME})
+  # Only an addition can be a sum of more than one constant. Declaring this lets
+  # Refex skip every other node (Names, Calls, ...) without calling _match.
+  type_filter = frozenset({ast.BinOp})
 
   def _match(self, context, candidate):
-    if not isinstance(candidate, ast.AST):
-      return None
-
-    # Walk the AST to collect the answer:
-    values = []
-    for node in ast.walk(candidate):
-      # Every node must either be a Constant/Num or an addition node.
+    # Walk the AST to collect the answer. Rather than ast.walk(), we use an
+    # explicit stack, so that anything other than an addition of constants
+    # fails as soon as it's found, without walking the rest of the tree.
+    total = 0
+    count = 0
+    stack = [candidate]
+    while stack:
+      node = stack.pop()
+      # Binary operator nodes are allowed, but only if they have an Add() op.
+      if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        stack.append(node.right)
+        stack.append(node.left)
+        continue
+      # Every other node must be a constant.
       if isinstance(node, ast.Constant):
-        values.append(node.value)
-      elif isinstance(node, ast.Num):  # older pythons
-        values.append(node.n)
-      elif isinstance(node, ast.BinOp) or isinstance(node, ast.Add):
-        # Binary operator nodes are allowed, but only if they have an Add() op.
-        pass
+        value = node.value
+      elif sys.version_info < (3, 8) and isinstance(node, ast.Num):
+        value = node.n  # older pythons
       else:
         return None  # not a +, not a constant
-
-      # For more complex tasks, or for tasks which integrate into how Refex
-      # builds results and bindings, it can be helpful to defer work into a
-      # submatcher, such as by running BinOp(op=Add()).match(context, candidate)
+      if not isinstance(value, numbers.Number):
+        # 'a' + 'b' is an addition of constants, but it isn't a sum.
+        return None
+      total += value
+      count += 1
 
     # Having walked the AST, we have determined that the whole tree is addition
-    # of constants, and have collected all of those constants in a list.
-    if len(values) <= 1:
+    # of constants, and have added all of those constants together.
+    if count <= 1:
       # Don't bother emitting a replacement for e.g. 7 with itself.
       return None
-    result = str(sum(values))
 
     # Finally, we want to return the answer to Refex:
     # 1) bind the result to a variable
     # 2) return the tree itself as the matched value
 
-    # We can do this by deferring to a matcher that does the right thing.
+    # For more complex tasks, or for tasks which integrate into how Refex
+    # builds results and bindings, it can be helpful to defer work into a
+    # submatcher, and that is what we do here.
     # StringMatch() will produce a string literal match, and AllOf will retarget
     # the returned binding to the AST node which was passed in.
     submatcher = base_matchers.AllOf(
-        base_matchers.Bind("sum", base_matchers.StringMatch(result)))
+        base_matchers.Bind(_SUM_NAME, base_matchers.StringMatch(str(total))))
     return submatcher.match(context, candidate)
@@ -13,6 +13,8 @@
 # limitations under the License.
 """Tests for refex.examples.example_custom_matcher."""
 
+import ast
+
 from absl.testing import absltest
 
 from refex import search
@@ -36,6 +38,31 @@ class SumMatcherTest(absltest.TestCase):
         search.rewrite_string(self.SEARCH_REPLACE, '1 + var', 'filename.py'),
         '1 + var')
 
+  def test_string_concatenation_no_rewrite(self):
+    self.assertEqual(
+        search.rewrite_string(self.SEARCH_REPLACE, "'a' + 'b'", 'filename.py'),
+        "'a' + 'b'")
+
+  def test_type_filter(self):
+    self.assertEqual(example_custom_matcher.SumMatcher().type_filter,
+                     frozenset({ast.BinOp}))
+
+  def test_sum_no_rewrite_other_operator(self):
+    self.assertEqual(
+        search.rewrite_string(self.SEARCH_REPLACE, '1 * 2', 'filename.py'),
+        '1 * 2')
+
+  def test_sum_rewrite_nested(self):
+    self.assertEqual(
+        search.rewrite_string(self.SEARCH_REPLACE, '(1 + 2) * 3', 'filename.py'),
+        '(3) * 3')
+
+  def test_sum_rewrite_with_pragmas(self):
+    self.assertEqual(
+        search.rewrite_string(self.SEARCH_REPLACE,
+                              '1 + 2  # pylint: disable=foo', 'filename.py'),
+        '3  # pylint: disable=foo')
+
 
 if __name__ == '__main__':
   absltest.main()
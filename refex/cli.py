@@ -23,26 +23,20 @@ point to allow for users to extend the refex CLI with new features.
 
 import abc
 import argparse
-import atexit
-import collections
 import contextlib
-import cProfile as profile
 import errno
 import io
-import json
 import os
 import re
 import sys
-import tempfile
 import textwrap
-import traceback
-from typing import Callable, Dict, Generic, IO, Iterable, Optional, Text, Tuple, TypeVar, Union
+from typing import Callable, Dict, Generic, IO, Iterable, Optional, Tuple, TypeVar, Union
 
-from absl import app
 from absl.flags import argparse_flags
 import attr
+# colorama and syntactic_template are not imported lazily: formatting and search
+# import them regardless.
 import colorama
-import pkg_resources
 from refex import formatting
 from refex import search
 from refex.fix import find_fixer
@@ -54,8 +48,24 @@ _IGNORABLE_ERRNO = frozenset([
 ])
 
 
-def _shorten_path(path):
-  filenames = [path, os.path.abspath(path), os.path.relpath(path)]
+# The style for filenames printed before their matches.
+_FILENAME_START = colorama.Style.RESET_ALL + colorama.Fore.MAGENTA
+
+
+def _shorten_path(path, cwd=None):
+  """Returns the shortest of ``path``, its absolute path, and its relative path.
+
+  Args:
+    path: A file path.
+    cwd: The current working directory, if already known.
+  """
+  if not os.path.isabs(path) and os.sep not in path:
+    # A bare filename is already as short as it gets.
+    return path
+  if cwd is None:
+    cwd = os.getcwd()
+  abspath = os.path.normpath(os.path.join(cwd, path))
+  filenames = [path, abspath, os.path.relpath(abspath, cwd)]
   return min(filenames, key=len)
 
 
@@ -145,11 +155,11 @@ class RefexRunner:
       with io.open(path, 'rb') as d:
         return self.codec.read(d)
     except UnicodeDecodeError as e:
-      print('skipped %s: UnicodeDecodeError: %s' % (path, e), file=sys.stderr)
+      print(f'skipped {path}: UnicodeDecodeError: {e}', file=sys.stderr)
       return None
     except IOError as e:
       if e.errno not in _IGNORABLE_ERRNO:
-        print('skipped %s: IOError: %s' % (path, e.strerror), file=sys.stderr)
+        print(f'skipped {path}: IOError: {e.strerror}', file=sys.stderr)
       return None
 
   def get_matches(self, contents, path):
@@ -160,7 +170,10 @@ class RefexRunner:
       path: The path to the above content.
 
     Returns:
-      A list of refex Match objects.
+      A list of refex Match objects. This is the only copy of the matches: it
+      is shared by :meth:`log_changes` and :meth:`write`. (It can't be a lazy
+      iterator, because both of them consume it, and because search errors
+      must be raised here, where :meth:`rewrite_files` catches them.)
     """
     try:
       return list(
@@ -170,42 +183,51 @@ class RefexRunner:
     except search.SkipFileNoResultsError:
       return []
     except search.SkipFileError as e:
-      print('skipped %s: %s' % (path, e), file=sys.stderr)
+      print(f'skipped {path}: {e}', file=sys.stderr)
       return []
 
   def write(self, path, result, matches):
+    if not matches:
+      return
+    data = formatting.apply_substitutions(result.data, matches)
+    if data == result.data:
+      # Don't touch files that wouldn't change, e.g. so that their mtime is
+      # left alone.
+      return
+    result.data = data
     try:
       with io.open(path, 'wb') as f:
-        result.data = formatting.apply_substitutions(result.data, matches)
         self.codec.write(f, result)
     except IOError as e:
-      print('skipped %s: IOError: %s' % (path, e), file=sys.stderr)
+      print(f'skipped {path}: IOError: {e}', file=sys.stderr)
 
   # TODO(b/131232240): Make this thread safe.
   def log_changes(self, content, matches, name, renderer):
     """Prints any changes, depending on the config."""
     # It's probably worth rewriting this so that it yields strings of the
     # partial diffs instead of a bool?
-    if not matches:
-      return False
     if not self.show_diff and not self.show_files:
       return False
+    if not matches:
+      return False
     if not self.show_diff and self.show_files:
       print(name)
       return False
 
     if self.show_files:
-      print(('{colorama.Style.RESET_ALL}{colorama.Fore.MAGENTA}'
-             '{filename}'
-             '{colorama.Style.RESET_ALL}'.format(
-                 colorama=colorama, filename=name)))
+      print(f'{_FILENAME_START}{name}{colorama.Style.RESET_ALL}')
     has_any_changes = False
+    # The diff is written (and flushed) once per file, rather than once per
+    # part.
+    parts = []
     for has_changes, part in formatting.diff_substitutions(
         content, matches, name, renderer):
       has_any_changes = has_any_changes or has_changes
       if part:
-        sys.stdout.write(part)
-        sys.stdout.flush()
+        parts.append(part)
+    if parts:
+      sys.stdout.write(''.join(parts))
+      sys.stdout.flush()
     return has_any_changes
 
   def rewrite_files(self, path_pairs):
@@ -222,25 +244,25 @@ class RefexRunner:
     """
     failures = {}
     has_changes = False
+    cwd = os.getcwd()
     for read, write in path_pairs:
-      display_name = _shorten_path(write)
+      display_name = _shorten_path(write, cwd)
       result = self.read(read)
       if result is not None:
         try:
           matches = self.get_matches(result.data, display_name)
         except Exception as e:  # pylint: disable=broad-except
+          import traceback  # pylint: disable=g-import-not-at-top
           failures[read] = {
               'content': result.data,
               'traceback': traceback.format_exc()
           }
           print(
-              'skipped {path}: {e.__class__.__name__}: {e}'.format(
-                  path=read, e=e),
-              file=sys.stderr)
+              f'skipped {read}: {e.__class__.__name__}: {e}', file=sys.stderr)
         else:
-          has_changes |= (
-              self.log_changes(result.data, matches, display_name,
-                               self.renderer))
+          if self.show_diff or self.show_files:
+            has_changes |= self.log_changes(result.data, matches, display_name,
+                                            self.renderer)
           if not self.dry_run and matches:
             self.write(write, result, matches)
     if has_changes and self.dry_run:
@@ -259,7 +281,7 @@ _BUG_REPORT_URL = 'https://github.com/ssbr/refex/issues/new/choose'
 # and replacement templates on the command line.
 
 
-@attr.s
+@attr.s(slots=True)
 class _SearchReplaceArgument:
   """A --match/--sub pair."""
   #: The pattern.
@@ -281,13 +303,15 @@ class _AddMatchAction(argparse.Action):
   def __init__(self, option_strings, dest, nargs=None, **kwargs):
     if nargs is not None:
       raise ValueError('nargs not allowed')
-    super(_AddMatchAction, self).__init__(option_strings, dest, **kwargs)
+    super().__init__(option_strings, dest, **kwargs)
 
   def __call__(self, parser, namespace, value, option_string=None):
     search_replaces = _setdefault_searchreplace(namespace, self.dest)
-    if search_replaces[-1].match is not None:
-      search_replaces.append(_SearchReplaceArgument())
-    search_replaces[-1].match = value
+    search_replace = search_replaces[-1]
+    if search_replace.match is not None:
+      search_replace = _SearchReplaceArgument()
+      search_replaces.append(search_replace)
+    search_replace.match = value
 
 
 class _AddSubAction(argparse.Action):
@@ -295,17 +319,17 @@ class _AddSubAction(argparse.Action):
   def __init__(self, option_strings, dest, nargs=None, **kwargs):
     if nargs is not None:
       raise ValueError('nargs not allowed')
-    super(_AddSubAction, self).__init__(option_strings, dest, **kwargs)
+    super().__init__(option_strings, dest, **kwargs)
 
   def __call__(self, parser, namespace, value, option_string=None):
-    search_replaces = _setdefault_searchreplace(namespace, self.dest)
-    old_sub = search_replaces[-1].sub
+    search_replace = _setdefault_searchreplace(namespace, self.dest)[-1]
+    old_sub = search_replace.sub
     if old_sub:
       parser.error(
           'The most recent --match pattern has already had a substitution defined (tried to overwrite %s with --sub %s)'
           % (old_sub, value))
 
-    search_replaces[-1].sub = {search.ROOT_LABEL: value}
+    search_replace.sub = {search.ROOT_LABEL: value}
 
 
 class _AddNamedSubAction(argparse.Action):
@@ -314,13 +338,13 @@ class _AddNamedSubAction(argparse.Action):
   def __init__(self, option_strings, dest, nargs=None, **kwargs):
     if nargs is not None:
       raise ValueError('nargs not allowed')
-    super(_AddNamedSubAction, self).__init__(option_strings, dest, **kwargs)
+    super().__init__(option_strings, dest, **kwargs)
 
   def __call__(self, parser, namespace, value, option_string=None):
-    search_replaces = _setdefault_searchreplace(namespace, self.dest)
-    old_sub = search_replaces[-1].sub
+    search_replace = _setdefault_searchreplace(namespace, self.dest)[-1]
+    old_sub = search_replace.sub
     if old_sub is None:
-      old_sub = search_replaces[-1].sub = {}
+      old_sub = search_replace.sub = {}
     if search.ROOT_LABEL in old_sub:
       parser.error(
           "Can't combine --sub and --named-sub (tried to merge "
@@ -337,8 +361,8 @@ class _AddNamedSubAction(argparse.Action):
 
 def run(runner: RefexRunner,
         files: Iterable[Union[str, Tuple[str, str]]],
-        bug_report_url: Text,
-        version: Text = '<unspecified>'):
+        bug_report_url: str,
+        version: str = '<unspecified>'):
   """Performs console setup, and runs.
 
   Args:
@@ -351,9 +375,15 @@ def run(runner: RefexRunner,
   """
   files = (
       (fname, fname) if isinstance(fname, str) else fname for fname in files)
+  if runner.renderer.color and sys.platform != 'win32':
+    # The terminal handles ANSI codes itself, so there's nothing for colorama to
+    # strip or convert, and no need to wrap stdout/stderr.
+    console = contextlib.nullcontext()
+  else:
+    console = colorama.colorama_text(strip=not runner.renderer.color)
   try:
     with _report_bug_excepthook(bug_report_url):
-      with colorama.colorama_text(strip=not runner.renderer.color):
+      with console:
         report_failures(
             runner.rewrite_files(files),
             bug_report_url,
@@ -407,12 +437,16 @@ def run_cli(
         run(runner, files, bug_report_url, version)
 
       if options.profile_to:
+        import cProfile as profile  # pylint: disable=g-import-not-at-top
         profiler = profile.Profile()
-        atexit.register(profiler.dump_stats, options.profile_to)
-        profiler.runcall(_run)
+        try:
+          profiler.runcall(_run)
+        finally:
+          profiler.dump_stats(options.profile_to)
       else:
         _run()
 
+    from absl import app  # pylint: disable=g-import-not-at-top
     try:
       app.run(_main, argv=list(argv), flags_parser=parse_flags)
     except KeyboardInterrupt:
@@ -434,6 +468,11 @@ def report_failures(failures, bug_report_url, version, verbose):
   if not failures:
     return
 
+  # pylint: disable=g-import-not-at-top
+  import json
+  import tempfile
+  # pylint: enable=g-import-not-at-top
+
   if verbose:
     for fname, failure in failures.items():
       print('Error processing', fname, file=sys.stderr)
@@ -465,21 +504,25 @@ def _fixer_from_pattern(pattern, templates):
   return find_fixer.from_pattern(pattern)
 
 
-_SEARCH_MODES = collections.OrderedDict([
-    ('re', search.RegexSearcher.from_pattern),
-    ('py', search.PyMatcherRewritingSearcher.from_pattern),
-    ('py.expr', search.PyExprRewritingSearcher.from_pattern),
-    ('py.stmt', search.PyStmtRewritingSearcher.from_pattern),
-    ('fix', _fixer_from_pattern),
-])
+_SEARCH_MODES = {
+    're': search.RegexSearcher.from_pattern,
+    'py': search.PyMatcherRewritingSearcher.from_pattern,
+    'py.expr': search.PyExprRewritingSearcher.from_pattern,
+    'py.stmt': search.PyStmtRewritingSearcher.from_pattern,
+    'fix': _fixer_from_pattern,
+}
 
-_SUB_MODES = collections.OrderedDict([
-    ('re', formatting.RegexTemplate),
-    ('sh', formatting.ShTemplate),
-    ('py', syntactic_template.PythonTemplate),
-    ('py.expr', syntactic_template.PythonExprTemplate),
-    ('py.stmt', syntactic_template.PythonStmtTemplate),
-])
+_SEARCH_MODE_CHOICES = tuple(sorted(_SEARCH_MODES))
+
+_SUB_MODES = {
+    're': formatting.RegexTemplate,
+    'sh': formatting.ShTemplate,
+    'py': syntactic_template.PythonTemplate,
+    'py.expr': syntactic_template.PythonExprTemplate,
+    'py.stmt': syntactic_template.PythonStmtTemplate,
+}
+
+_SUB_MODE_CHOICES = ('auto',) + tuple(_SUB_MODES)
 
 _DEFAULT_SUB_MODES = {
     're': 're',
@@ -493,11 +536,15 @@ _NONZERO_ITERATION_MODES = frozenset({'fix'})
 
 assert set(_DEFAULT_SUB_MODES) == set(_SEARCH_MODES)
 
-_color_choices = collections.OrderedDict([
-    ('never', False),
-    ('always', True),
-    ('auto', sys.stdout.isatty()),
-])
+_color_choices = {
+    'never': False,
+    'always': True,
+    # Resolved by _parse_options, so that building a parser doesn't check
+    # whether stdout is a terminal.
+    'auto': None,
+}
+
+_COLOR_CHOICES = tuple(_color_choices)
 
 
 @contextlib.contextmanager
@@ -571,16 +618,18 @@ def _add_rewriter_arguments(parser):
       metavar='REGEX',
       help='Filenames that must match to include'
       ' (regular expression).')
+  # --also and --noalso are compiled by runner_from_options, when (and if) the
+  # searcher is built.
   parser.add_argument(
       '--also',
-      type=search.default_compile_regex,
+      type=str,
       metavar='REGEX',
       action='append',
       default=[],
       help='Regexes that must also match somewhere in the file.')
   parser.add_argument(
       '--noalso',
-      type=search.default_compile_regex,
+      type=str,
       metavar='REGEX',
       action='append',
       default=[],
@@ -588,7 +637,7 @@ def _add_rewriter_arguments(parser):
   parser.add_argument(
       '--color',
       help='Whether to color the output.',
-      choices=tuple(_color_choices))
+      choices=_COLOR_CHOICES)
   parser.add_argument(
       '--nocolor',
       help='Disable output color. (DEPRECATED)',
@@ -693,6 +742,9 @@ def _parse_args_leftovers(parser, args):
     options, leftovers
   """
   options, unknown = parser.parse_known_args(args)
+  if not unknown:
+    # e.g. if the only positional argument was PATTERN_OR_FILE.
+    return options, []
   leftovers = []
   unknown_it = iter(unknown)
   unrecognized_flags = []
@@ -734,6 +786,8 @@ def _parse_options(argv, parser):
       options.files.append(options.pattern_or_file)
   options.files.extend(args)
   options.color = _color_choices[options.color]
+  if options.color is None:
+    options.color = sys.stdout.isatty()
   options.renderer = formatting.Renderer(
       match_format=options.format,
       color=options.color,
@@ -774,7 +828,7 @@ def argument_parser():
 
   match_options.add_argument(
       '--mode',
-      choices=sorted(_SEARCH_MODES),
+      choices=_SEARCH_MODE_CHOICES,
       required=True,
       help='Pattern matching mode')
 
@@ -820,7 +874,7 @@ def argument_parser():
 
   match_options.add_argument(
       '--sub-mode',
-      choices=['auto'] + list(_SUB_MODES),
+      choices=_SUB_MODE_CHOICES,
       default='auto',
       help=(r'Substitution syntax type e.g. \g<foo> (re) vs $foo (sh).'
             ' Defaults to re for --mode=re, sh for all other modes.'))
@@ -876,8 +930,13 @@ def runner_from_options(parser, options) -> RefexRunner:
     searcher = search.CombinedSearcher(searchers)
 
   if options.also or options.noalso:
+    try:
+      also = [search.default_compile_regex(r) for r in options.also]
+      also_not = [search.default_compile_regex(r) for r in options.noalso]
+    except ValueError as e:
+      parser.error(str(e))
     searcher = search.AlsoRegexpSearcher(
-        searcher=searcher, also=options.also, also_not=options.noalso)
+        searcher=searcher, also=also, also_not=also_not)
 
   if not options.force_enable:
     searcher = search.PragmaSuppressedSearcher(searcher)
@@ -922,11 +981,14 @@ def main(argv=None, bug_report_url=_BUG_REPORT_URL, version=None):
   if argv is None:
     argv = sys.argv
   if version is None:
+    # Unlike pkg_resources, importlib.metadata doesn't scan every installed
+    # distribution when imported.
+    from importlib import metadata  # pylint: disable=g-import-not-at-top
     try:
-      version = pkg_resources.get_distribution('refex').version
-    except pkg_resources.DistributionNotFound as e:
+      version = metadata.version('refex')
+    except metadata.PackageNotFoundError as e:
       # e.g. if vendored *cough* :(
-      version = 'DistributionNotFound: {e}\n{long_desc}'.format(
+      version = 'PackageNotFoundError: {e}\n{long_desc}'.format(
           e=e,
           long_desc='(refex needs to be installed to have version information)',
       )
@@ -12,13 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from absl import app
+import sys
+
+from absl import flags
 
 # Hack to get flags parsed -- both absl and the test runner expect to own main().
-# Fortunately, absl doesn't de-construct state after main finishes, so we
-# can pretend to give it what it wants.
-try:
-  app.run(lambda argv: None)
-except SystemExit:
-  # neener neener
-  pass
+# Only the flags need parsing, not the rest of app.run()'s setup (signal
+# handlers, logging, etc.), and pytest's own arguments aren't absl flags.
+if not flags.FLAGS.is_parsed():
+  flags.FLAGS(sys.argv, known_only=True)
@@ -16,46 +16,57 @@
 Fixers can be found in refex/fix/fixers.
 """
 
-import collections
+import functools
+import importlib
+import itertools
 
 from refex.fix import fixer
-from refex.fix.fixers import correctness_fixers
-from refex.fix.fixers import idiom_fixers
-from refex.fix.fixers import unittest_fixers
 
+# The built-in fixer groups, by name. Each module is only imported (and its
+# fixers built) the first time its group, or '*', is requested.
+_BUILTIN_FIXER_MODULES = {
+    'correctness': 'refex.fix.fixers.correctness_fixers',
+    'idiom': 'refex.fix.fixers.idiom_fixers',
+    'unittest': 'refex.fix.fixers.unittest_fixers',
+}
+
+# Fixers registered by register_default_fixers, included in '*' after the
+# built-in fixers.
 _default_fixers = []
-# Using OrderedDict instead of dict so that keeps the fixer order consistent
-# across runs for '*', and so we can tune the display order.
-_extra_fixers = collections.OrderedDict([('*', _default_fixers)])
+# dicts are insertion-ordered, which keeps the fixer order consistent across
+# runs, and lets us tune the display order.
+_extra_fixers = {}
 
 def register_default_fixers(fixers):
   """Registers a fixer list to be included in from_pattern('*')."""
   _default_fixers.extend(fixers)
+  from_pattern.cache_clear()
 
 def register_fixers(name, fixers):
   """Registers a fixer list to be returned by from_pattern(name)."""
-  if name in _extra_fixers:
+  if name == '*' or name in _BUILTIN_FIXER_MODULES or name in _extra_fixers:
     raise ValueError('Name already registered: %r', name)
   _extra_fixers[name] = fixers
+  from_pattern.cache_clear()
 
 
-def _register_builtins():
-  """Registers the built-in set of fixers. Invoked at import-time."""
-  register_fixers('correctness', correctness_fixers.SIMPLE_PYTHON_FIXERS)
-  register_fixers('idiom', idiom_fixers.SIMPLE_PYTHON_FIXERS)
-  register_fixers('unittest', unittest_fixers.SIMPLE_PYTHON_FIXERS)
-
-  for fixers in _extra_fixers.values():
-    register_default_fixers(fixers)
-
-_register_builtins()
+@functools.lru_cache(maxsize=None)
+def _builtin_fixers(name):
+  """Imports and returns the built-in fixer group `name`."""
+  return importlib.import_module(
+      _BUILTIN_FIXER_MODULES[name]).SIMPLE_PYTHON_FIXERS
 
 
+@functools.lru_cache(maxsize=None)
 def from_pattern(fixer_pattern: str) -> fixer.CombiningPythonFixer:
   """Provide a fixer that combines all the fixers specified in `fixer_pattern`.
 
+  Fixers are immutable, so the same one is returned for every call with the
+  same pattern, until more fixers are registered.
+
   To get all the default fixers, pass '*'. Otherwise, to get a group of fixers
-  by name, specify that name. (See _default_fixers & _extra_fixers).
+  by name, specify that name. (See _BUILTIN_FIXER_MODULES, _default_fixers &
+  _extra_fixers).
 
   Args:
     fixer_pattern: The pattern of fixers to load.
@@ -68,9 +79,18 @@ def from_pattern(fixer_pattern: str) -> fixer.CombiningPythonFixer:
   """
   # TODO: Allow you to do set operations like '*,-FixerNameHere', etc.
   # or something along those lines.
-  if fixer_pattern in _extra_fixers:
-    return fixer.CombiningPythonFixer(_extra_fixers[fixer_pattern])
+  if fixer_pattern == '*':
+    fixers = list(
+        itertools.chain.from_iterable(
+            _builtin_fixers(name) for name in _BUILTIN_FIXER_MODULES))
+    fixers.extend(_default_fixers)
+  elif fixer_pattern in _BUILTIN_FIXER_MODULES:
+    fixers = _builtin_fixers(fixer_pattern)
+  else:
+    fixers = _extra_fixers.get(fixer_pattern)
+  if fixers is not None:
+    return fixer.CombiningPythonFixer(fixers)
   else:
-    raise ValueError(
-        'Unknown fixer pattern %r: must provide one of: %s' %
-        (fixer_pattern, ', '.join(_extra_fixers.keys())))
+    raise ValueError('Unknown fixer pattern %r: must provide one of: %s' %
+                     (fixer_pattern, ', '.join(
+                         ['*', *_BUILTIN_FIXER_MODULES, *_extra_fixers])))
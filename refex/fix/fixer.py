@@ -15,11 +15,11 @@
 
 
 import abc
-import string
-from typing import Callable, List, Mapping, Optional, Text, TypeVar, Union
+import functools
+import re
+from typing import Callable, Mapping, Match, Optional, Text, Tuple, TypeVar, Union
 
 import attr
-import cached_property
 
 from refex import formatting
 from refex import search
@@ -28,9 +28,63 @@ from refex.python.matchers import base_matchers
 from refex.python.matchers import syntax_matchers
 
 
+# The placeholders in a string.Template: $$, $name, and ${name}.
+_TEMPLATE_PLACEHOLDER = re.compile(
+    r'\$(?:(?P<escaped>\$)|(?P<named>[_a-z][_a-z0-9]*)'
+    r'|{(?P<braced>[_a-z][_a-z0-9]*)}|(?P<invalid>))', re.IGNORECASE | re.ASCII)
+
+
+def _replace_placeholder(m: Match[str]) -> str:
+  if m.group('invalid') is not None:
+    raise ValueError(f'Invalid placeholder in string: {m.string!r}')
+  return m.group('escaped') or m.group('named') or m.group('braced')
+
+
+def _strip_dollars(template: str) -> str:
+  """Returns the ``string.Template`` ``template`` with ``$x`` replaced by ``x``.
+
+  This is equivalent to substituting an ``ImmutableDefaultDict(lambda k: k)``,
+  but in a single regex pass.
+  """
+  return _TEMPLATE_PLACEHOLDER.sub(_replace_placeholder, template)
+
+
+def _elide_placeholder(m: Match[str]) -> str:
+  if m.group('invalid') is not None:
+    raise ValueError(f'Invalid placeholder in string: {m.string!r}')
+  return m.group('escaped') or '...'
+
+
+@functools.lru_cache(maxsize=None)
+def summarize_template(template: str) -> str:
+  """Returns the ``string.Template`` ``template`` with ``$x`` replaced by ``...``.
+
+  This abbreviates a pattern or replacement template for use in a message.
+  For example, ``'$a is not $b'`` becomes ``'... is not ...'``.
+  """
+  return _TEMPLATE_PLACEHOLDER.sub(_elide_placeholder, template)
+
+
+@functools.lru_cache(maxsize=None)
+def _literal_template(text: str) -> formatting.LiteralTemplate:
+  """Returns a shared LiteralTemplate for ``text``.
+
+  Many fixers share a URL or category, and templates are immutable.
+  """
+  return formatting.LiteralTemplate(text)
+
+
+_SIGNIFICANT_TEMPLATE = formatting.LiteralTemplate('HACK_TRUE')
+
+# Matchers whose pattern can be turned into an example fragment.
+_PATTERN_TYPES = (syntax_matchers.ExprPattern, syntax_matchers.StmtPattern)
+
+
 class PythonFixer(metaclass=abc.ABCMeta):
   """Abstract base class for python-specific fixers operating via matchers."""
 
+  __slots__ = ()
+
   # Test helper methods:
 
   @abc.abstractmethod
@@ -54,7 +108,7 @@ class CombiningPythonFixer(search.FileRegexFilteredSearcher,
   This combines all of the matchers (``matcher_with_meta``) into one big
   ``AnyOf``, allowing for optimized traversal.
   """
-  fixers = attr.ib(type=List[PythonFixer])
+  fixers = attr.ib(type=Tuple[PythonFixer, ...], converter=tuple)
   include_regex = attr.ib(default=r'.*[.]py$', type=str)
 
   @fixers.validator
@@ -74,7 +128,7 @@ class CombiningPythonFixer(search.FileRegexFilteredSearcher,
         *(fixer.matcher_with_meta for fixer in self.fixers))
 
 
-@attr.s(frozen=True, eq=False)
+@attr.s(frozen=True, eq=False, slots=True)
 class SimplePythonFixer(PythonFixer):
   r"""A simple find-replace fixer.
 
@@ -107,40 +161,43 @@ class SimplePythonFixer(PythonFixer):
   _example_replacement = attr.ib(default=None, type=Optional[str])
   _significant = attr.ib(default=True, type=bool)
 
-  @cached_property.cached_property
-  def matcher_with_meta(self):
+  # Built once, eagerly, from the fields above.
+  _matcher_with_meta = attr.ib(init=False, repr=False, type=matcher.Matcher)
+
+  @_matcher_with_meta.default
+  def _matcher_with_meta_default(self):
     if isinstance(self._replacement, formatting.Template):
       replacements = {search.ROOT_LABEL: self._replacement}
     else:
-      replacements = self._replacement
+      # Copy, so as not to modify the caller's mapping.
+      replacements = dict(self._replacement)
 
     if self._message is not None:
       replacements[search.MESSAGE_LABEL] = formatting.LiteralTemplate(
           self._message)
     if self._url is not None:
-      replacements[search.URL_LABEL] = formatting.LiteralTemplate(self._url)
+      replacements[search.URL_LABEL] = _literal_template(self._url)
     if self._category is not None:
-      replacements[search.CATEGORY_LABEL] = formatting.LiteralTemplate(
-          self._category)
+      replacements[search.CATEGORY_LABEL] = _literal_template(self._category)
     if self._significant:
-      replacements[search.SIGNIFICANT_LABEL] = formatting.LiteralTemplate(
-          'HACK_TRUE')
+      replacements[search.SIGNIFICANT_LABEL] = _SIGNIFICANT_TEMPLATE
 
     return base_matchers.WithReplacements(
         base_matchers.SystemBind(search.ROOT_LABEL, self._matcher),
         replacements)
 
+  @property
+  def matcher_with_meta(self):
+    return self._matcher_with_meta
+
   def example_fragment(self):
     if self._example_fragment is not None:
       return self._example_fragment
-    if not isinstance(
-        self._matcher,
-        (syntax_matchers.ExprPattern, syntax_matchers.StmtPattern)):
+    if not isinstance(self._matcher, _PATTERN_TYPES):
       return None
     if self._matcher.restrictions:
       return None
-    return string.Template(self._matcher.pattern).substitute(
-        ImmutableDefaultDict(lambda k: k))
+    return _strip_dollars(self._matcher.pattern)
 
   def example_replacement(self):
     if self._example_fragment is not None:
@@ -152,8 +209,7 @@ class SimplePythonFixer(PythonFixer):
       raise TypeError(
           'Cannot autogenerate an example replacement unless the replacement'
           ' template applies to the whole match.')
-    return string.Template(self._replacement.template).substitute(
-        ImmutableDefaultDict(lambda k: k))
+    return _strip_dollars(self._replacement.template)
 
 
 KeyType = TypeVar('KeyType')
@@ -172,4 +228,4 @@ class ImmutableDefaultDict(Mapping[KeyType, ValueType]):
     return 0
 
   def __iter__(self):
-    return iter([])
+    return iter(())
@@ -20,10 +20,7 @@
 * ``yaml.load()`` includes security traps.
 """
 
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-from __future__ import unicode_literals  # for convenience
+import functools
 
 from refex import formatting
 from refex.fix import fixer
@@ -37,12 +34,22 @@ _STRING_LITERAL = base_matchers.AnyOf(ast_matchers.Str(), ast_matchers.Bytes())
 # A "literal" for the purposes of buggy is/is not checks.
 _LITERAL = base_matchers.AnyOf(ast_matchers.Num(), _STRING_LITERAL)
 
+# Shared by every _attrib_mutable_default_fixer.
+_ATTRIB_FUNC = syntax_matchers.ExprPattern('attr.ib')
+_DEFAULT_ARG = base_matchers.Equals('default')
+
 _YAML_MESSAGE = (
     'yaml.{function} can execute arbitrary Python code contained in the input. '
     'Use yaml.safe_load instead. This may require changing dumps to use '
     'yaml.safe_dump.')
 
 
+@functools.lru_cache(maxsize=None)
+def _sh_template(text):
+  """Returns a shared ShTemplate for ``text``."""
+  return formatting.ShTemplate(text)
+
+
 def _attrib_mutable_default_fixer(default, keyword_replacement):
   """Replaces an attr.ib(default=<default>) call where the default is mutable.
 
@@ -70,14 +77,14 @@ def _attrib_mutable_default_fixer(default, keyword_replacement):
           ' Mutable defaults should instead use factory=..., to get a unique'
           ' value.'),
       matcher=ast_matchers.Call(
-          func=syntax_matchers.ExprPattern('attr.ib'),
+          func=_ATTRIB_FUNC,
           keywords=base_matchers.Contains(
               base_matchers.Bind(
                   'keyword',
                   ast_matchers.keyword(
-                      arg=base_matchers.Equals('default'),
+                      arg=_DEFAULT_ARG,
                       value=syntax_matchers.ExprPattern(default))))),
-      replacement={'keyword': formatting.ShTemplate(keyword_replacement)},
+      replacement={'keyword': _sh_template(keyword_replacement)},
       url='https://refex.readthedocs.io/en/latest/guide/fixers/attrib_default.html',
       category='refex.correctness.attrib-default',
       example_fragment='attr.ib(default=%s)' % default,
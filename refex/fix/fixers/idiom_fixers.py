@@ -21,7 +21,6 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals  # for convenience
 
-import string
 import textwrap
 
 from refex import formatting
@@ -57,11 +56,10 @@ def idiom_fixer(
   Returns:
     A fixer that replaces old_expr with new_expr.
   """
-  dotdotdot = fixer.ImmutableDefaultDict(lambda _: '...')
   return fixer.SimplePythonFixer(
       message=('This could be more Pythonic: %s -> %s.' %
-               ((string.Template(old_expr).substitute(dotdotdot),
-                 string.Template(new_expr).substitute(dotdotdot)))),
+               (fixer.summarize_template(old_expr),
+                fixer.summarize_template(new_expr))),
       matcher=syntax_matchers.ExprPattern(old_expr),
       replacement=syntactic_template.PythonExprTemplate(new_expr),
       url=url,
@@ -105,7 +103,8 @@ _NON_NONE_RETURN = base_matchers.DebugLabeledMatcher(
     ast_matchers.Return(
         value=base_matchers.Unless(
             base_matchers.AnyOf(
-                base_matchers.Equals(None), syntax_matchers.ExprPattern('None')
+                base_matchers.Equals(None),
+                ast_matchers.NameConstant(value=base_matchers.Equals(None)),
             )
         )
     ),
@@ -240,8 +239,6 @@ _MUTABLE_CONSTANT_FIXERS = (
 _NEGATION_CATEGORY = 'pylint.g-comparison-negation'
 _UNNECESSARY_COMPREHENSION_CATEGORY = 'idioms.uncessary-comprehension'
 
-_Try = getattr(ast_matchers, 'Try', getattr(ast_matchers, 'TryExcept', None))  # type alias; pylint: disable=invalid-name
-
 
 def _in_exception_handler(identifier, on_conflict):
   """Returns a matcher for a node in the nearest ancestor `except` & binds `identifier`.
@@ -279,14 +276,17 @@ _LOGGING_FIXERS = (
                     syntax_matchers.ExprPattern('logging.error')),
                 args=base_matchers.Contains(
                     base_matchers.AllOf(
-                        _in_exception_handler(
-                            'e',
-                            on_conflict=matcher_.BindConflict.MERGE_IDENTICAL),
+                        # Check for a Name first, so that only those args walk
+                        # up to the enclosing except handler.
                         ast_matchers.Name(
                             id=base_matchers.Bind(
                                 'e',
                                 on_conflict=matcher_.BindConflict
-                                .MERGE_IDENTICAL)))),
+                                .MERGE_IDENTICAL)),
+                        _in_exception_handler(
+                            'e',
+                            on_conflict=matcher_.BindConflict.MERGE_IDENTICAL),
+                    )),
                 keywords=base_matchers.Unless(
                     base_matchers.Contains(
                         ast_matchers.keyword(arg='exc_info'))),
@@ -328,8 +328,8 @@ _LOGGING_FIXERS = (
             _in_exception_handler(
                 'e', on_conflict=matcher_.BindConflict.MERGE_IDENTICAL),
             syntax_matchers.HasFirstAncestor(
-                _Try(),
-                _Try(
+                ast_matchers.Try(),
+                ast_matchers.Try(
                     # For simplicity, try to match only cases where the try:
                     # block failure can clearly be caused only by the
                     # matched function call. This isn't perfect, since it
@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import textwrap
-import unittest
 
 from absl.testing import absltest
 from absl.testing import parameterized
@@ -27,6 +26,22 @@ def _rewrite(fixer_, code):
   return search.rewrite_string(fixer_, code, 'example.py')
 
 
+# Shared by the logging test cases, rather than combining the fixers twice.
+_COMBINED_LOGGING_FIXER = fixer.CombiningPythonFixer(
+    idiom_fixers._LOGGING_FIXERS)
+
+
+class IdiomFixerTest(absltest.TestCase):
+
+  def test_message(self):
+    fx = idiom_fixers.idiom_fixer('not $a in $b', '$a not in $b', 'TESTONLY')
+    [m] = search.find_iter(
+        fixer.CombiningPythonFixer([fx]), 'not x in y', 'example.py')
+    self.assertEqual(
+        m.message,
+        'This could be more Pythonic: not ... in ... -> ... not in ....')
+
+
 class ComprehensionFixerTest(absltest.TestCase):
   fixers = fixer.CombiningPythonFixer(idiom_fixers.SIMPLE_PYTHON_FIXERS)
 
@@ -295,7 +310,7 @@ class MutableConstantFixers(parameterized.TestCase):
 
 
 class LoggingErrorFixerTest(parameterized.TestCase):
-  fixers = fixer.CombiningPythonFixer(idiom_fixers._LOGGING_FIXERS)
+  fixers = _COMBINED_LOGGING_FIXER
 
   def test_nested_try_except(self):
     before = textwrap.dedent("""
@@ -368,7 +383,7 @@ class LoggingErrorFixerTest(parameterized.TestCase):
 
 
 class LoggingExceptionFixerTest(parameterized.TestCase):
-  fixers = fixer.CombiningPythonFixer(idiom_fixers._LOGGING_FIXERS)
+  fixers = _COMBINED_LOGGING_FIXER
 
   @parameterized.named_parameters(
       ('function_call_without_args', 'dangerous_func()', 'dangerous_func'),
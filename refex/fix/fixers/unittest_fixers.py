@@ -25,12 +25,18 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals  # for convenience
 
-import string
+import functools
 
 from refex.fix import fixer
 from refex.python import syntactic_template
 from refex.python.matchers import syntax_matchers
 
+# Patterns and templates are immutable, and many fixers share a replacement,
+# so each distinct string is only parsed once.
+_expr_pattern = functools.lru_cache(maxsize=None)(syntax_matchers.ExprPattern)
+_expr_template = functools.lru_cache(maxsize=None)(
+    syntactic_template.PythonExprTemplate)
+
 
 def assert_alias_fixer(
     old_expr,
@@ -46,14 +52,13 @@ def assert_alias_fixer(
   Returns:
     A fixer that replaces old_expr with new_expr.
   """
-  dotdotdot = fixer.ImmutableDefaultDict(lambda _: '...')
   return fixer.SimplePythonFixer(
       message=('{old} is a deprecated alias for {new} in the unittest module.'
                .format(
-                   old=string.Template(old_expr).substitute(dotdotdot),
-                   new=string.Template(new_expr).substitute(dotdotdot))),
-      matcher=syntax_matchers.ExprPattern(old_expr),
-      replacement=syntactic_template.PythonExprTemplate(new_expr),
+                   old=fixer.summarize_template(old_expr),
+                   new=fixer.summarize_template(new_expr))),
+      matcher=_expr_pattern(old_expr),
+      replacement=_expr_template(new_expr),
       url=url,
       significant=False,
       category='pylint.g-deprecated-assert',
@@ -82,14 +87,13 @@ def assert_message_fixer(old_expr, new_expr, method, is_absl=False):
     url = f'https://github.com/abseil/abseil-py/search?q=%22def+{method}%22'
   else:
     url = f'https://docs.python.org/3/library/unittest.html#unittest.TestCase.{method}'
-  dotdotdot = fixer.ImmutableDefaultDict(lambda _: '...')
   return fixer.SimplePythonFixer(
       message=(
           '%s is a more specific assertion, and may give more detailed error information than %s.'
-          % (string.Template(new_expr).substitute(dotdotdot),
-             string.Template(old_expr).substitute(dotdotdot))),
-      matcher=syntax_matchers.ExprPattern(old_expr),
-      replacement=syntactic_template.PythonExprTemplate(new_expr),
+          % (fixer.summarize_template(new_expr),
+             fixer.summarize_template(old_expr))),
+      matcher=_expr_pattern(old_expr),
+      replacement=_expr_template(new_expr),
       url=url,
       category='pylint.g-generic-assert',
   )
@@ -120,16 +124,6 @@ SIMPLE_PYTHON_FIXERS = [
         'self.assertNotEqual($lhs, $rhs)',
         'assertNotEqual',
     ),
-    assert_message_fixer(
-        'self.assertTrue($lhs == $rhs)',
-        'self.assertEqual($lhs, $rhs)',
-        'assertEqual',
-    ),
-    assert_message_fixer(
-        'self.assertTrue($lhs != $rhs)',
-        'self.assertNotEqual($lhs, $rhs)',
-        'assertNotEqual',
-    ),
     # is, is not
     # We could also change 'assertIs(..., None)' to 'assertIsNone(...)',
     # but the error messages are identical, so this suggestion would
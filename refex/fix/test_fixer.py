@@ -72,6 +72,12 @@ class PythonFixerFrameworkTest(parameterized.TestCase):
     fx = fixer.CombiningPythonFixer([])
     self.assertEqual(list(search.find_iter(fx, 'b', 'foo.py')), [])
 
+  def test_fixers_frozen(self):
+    pyfixers = [_search_replace_fixer('a', 'x')]
+    fx = fixer.CombiningPythonFixer(pyfixers)
+    pyfixers.append(_search_replace_fixer('b', 'x'))
+    self.assertLen(fx.fixers, 1)
+
   def test_empty_results(self):
     fx = fixer.CombiningPythonFixer([_search_replace_fixer('a', 'x')])
     self.assertEqual(list(search.find_iter(fx, 'b', 'foo.py')), [])
@@ -282,6 +288,15 @@ class PythonFixerFrameworkTest(parameterized.TestCase):
         list(search.find_iter(fx, 'a1, b1', 'foo.py', max_iterations=10)),
         [_substitution(replacements={'fixedpoint': 'final'})])
 
+  def test_labeled_replacements_not_modified(self):
+    replacement = {'y': syntactic_template.PythonExprTemplate('$y')}
+    fixer.SimplePythonFixer(
+        message='message',
+        matcher=syntax_matchers.ExprPattern('$y'),
+        replacement=replacement,
+    ).matcher_with_meta  # pylint: disable=expression-not-assigned
+    self.assertEqual(list(replacement), ['y'])
+
   def test_labeled_replacements_example_fragment(self):
     fx = fixer.SimplePythonFixer(
         message='',
@@ -295,6 +310,20 @@ class PythonFixerFrameworkTest(parameterized.TestCase):
 class PythonFixerTest(parameterized.TestCase):
   FIXER = find_fixer.from_pattern('*')
 
+  def test_from_pattern_cached(self):
+    self.assertIs(find_fixer.from_pattern('*'), self.FIXER)
+
+  def test_from_pattern_all_groups(self):
+    grouped = [
+        fx for name in ('correctness', 'idiom', 'unittest')
+        for fx in find_fixer.from_pattern(name).fixers
+    ]
+    self.assertEqual(grouped, list(self.FIXER.fixers))
+
+  def test_from_pattern_unknown(self):
+    with self.assertRaisesRegex(ValueError, 'correctness'):
+      find_fixer.from_pattern('not_a_fixer_group')
+
   @parameterized.parameters('bare_foo.py', 'foo/bar.py', 'foo/bar_test.py')
   def test_includes_paths(self, path):
     self.assertRegex(path, self.FIXER.include_regex)
@@ -321,6 +350,36 @@ class ImmutableDefaultDictTest(absltest.TestCase):
     self.assertEmpty(fixer.ImmutableDefaultDict(lambda _: 'a'))
 
 
+class StripDollarsTest(parameterized.TestCase):
+
+  @parameterized.parameters('$a == $b', '${a}b', '$$a', 'a', '$_a1 + $B')
+  def test_same_as_template(self, template):
+    self.assertEqual(
+        fixer._strip_dollars(template),
+        string.Template(template).substitute(
+            fixer.ImmutableDefaultDict(lambda k: k)))
+
+  def test_invalid(self):
+    with self.assertRaises(ValueError):
+      fixer._strip_dollars('$1')
+
+
+class SummarizeTemplateTest(parameterized.TestCase):
+
+  @parameterized.parameters(
+      ('not $a is $b', 'not ... is ...'),
+      ('${a}.x', '....x'),
+      ('$$a', '$a'),
+      ('a', 'a'),
+  )
+  def test_summarize(self, template, summary):
+    self.assertEqual(fixer.summarize_template(template), summary)
+
+  def test_invalid(self):
+    with self.assertRaises(ValueError):
+      fixer.summarize_template('$1')
+
+
 class DefaultFixerTest(absltest.TestCase):
 
   def assert_equivalent_under_mock(self, lhs, rhs, m):
@@ -375,6 +434,15 @@ class DefaultFixerTest(absltest.TestCase):
     # include things like the mock id / address in memory.
     # So we can't do `self.assertEqual(str(lhs_e), str(rhs_e))`
 
+  def test_no_duplicate_fixers(self):
+    # Fixers without an example fragment can't be compared this way.
+    fragments = [
+        fragment for fragment in (
+            fx.example_fragment() for fx in find_fixer.from_pattern('*').fixers)
+        if fragment is not None
+    ]
+    self.assertCountEqual(set(fragments), fragments)
+
   def test_smoke_equivalent(self):
     """Tests that the test fixer conversions seem equivalent."""
     for fx in find_fixer.from_pattern('*').fixers:
@@ -93,6 +93,11 @@ _DEFAULT_STYLES = (
     # colorama.Fore.GREEN,  # looks like a diff marker
 )
 
+# Separates consecutive diffs in diff_substitutions.
+_DIFF_SEPARATOR = (
+    colorama.Style.RESET_ALL + colorama.Fore.CYAN + '---' +
+    colorama.Style.RESET_ALL + '\n')
+
 
 # TODO: Move this onto the Substitution as a "context" span.
 def line_expanded_span(s: str, start: int, end: int) -> Tuple[int, int]:
@@ -170,10 +175,7 @@ def diff_substitutions(content: str, subs: Iterable[substitution.Substitution],
             filename=filename,
         ))
     if last_was_diff:
-      provided_display = (
-          '{colorama.Style.RESET_ALL}'
-          '{colorama.Fore.CYAN}---{colorama.Style.RESET_ALL}\n'.format(
-              colorama=colorama) + display)
+      provided_display = _DIFF_SEPARATOR + display
     else:
       provided_display = display
     yield is_diff, provided_display
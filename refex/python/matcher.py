@@ -1361,23 +1361,23 @@ def find_iter(matcher: Matcher,
     The successful results of ``matcher.match()`` (:class:`MatchInfo`).
   """
   context = MatchContext(parsed)
+  type_filter = matcher.type_filter
   stack = [parsed.tree]
   while stack:
     next_node = stack.pop()
-    new_context = context.new()
-    try:
-      if matcher.type_filter is None or type(next_node) in matcher.type_filter:
+    if type_filter is None or type(next_node) in type_filter:
+      # Only nodes that can match need their own context.
+      new_context = context.new()
+      try:
         match_info = matcher.match(new_context, next_node)
-      else:
-        match_info = None
-    except MatchError as e:
-      print('Matcher failed: {}'.format(e), file=sys.stderr)
-      continue
-    if match_info is not None:
-      context.update_success(new_context)
-      yield match_info
-      # Don't recurse inside: matches should be non-overlapping.
-      continue
+      except MatchError as e:
+        print('Matcher failed: {}'.format(e), file=sys.stderr)
+        continue
+      if match_info is not None:
+        context.update_success(new_context)
+        yield match_info
+        # Don't recurse inside: matches should be non-overlapping.
+        continue
 
     # Recurse down the AST:
     if isinstance(next_node, ast.AST):
@@ -597,15 +597,9 @@ class MatchesRegex(matcher.Matcher):
       default=Anything(), type=matcher.Matcher)
 
   @cached_property.cached_property
-  def _wrapped_regex(self):
-    """Wrapped regex with fullmatch semantics on match()."""
-    # fullmatch is anchored to both the start and end of the attempted span.
-    # since match is anchored at the start, we only need to anchor the end.
-    # $ works for this. (Interestingly, ^ wouldn't work for anchoring at the
-    # start of the span.)
-    # This is a hack to maintain Python 2 compatibility until this can be
-    # 3-only.
-    return re.compile('(?:%s)$' % self._regex)
+  def _compiled_regex(self):
+    """The regex, compiled once per matcher rather than once per match."""
+    return re.compile(self._regex)
 
   def _match(self, context, candidate):
     matchinfo = self._subpattern.match(context, candidate)
@@ -616,7 +610,7 @@ class MatchesRegex(matcher.Matcher):
     if span is None:
       return None  # can't search within this AST node.
     try:
-      m = self._wrapped_regex.match(context.parsed_file.text, *span)
+      m = self._compiled_regex.fullmatch(context.parsed_file.text, *span)
     except TypeError:
       return None
     if m is None:
@@ -624,7 +618,8 @@ class MatchesRegex(matcher.Matcher):
 
     # TODO(b/118507248): Allow choosing a different binding type.
     bindings = matcher.merge_bindings(
-        _re_match_to_bindings(self._wrapped_regex, context.parsed_file.text, m),
+        _re_match_to_bindings(self._compiled_regex, context.parsed_file.text,
+                              m),
         matchinfo.bindings)
 
     if bindings is None:
@@ -635,7 +630,7 @@ class MatchesRegex(matcher.Matcher):
   @cached_property.cached_property
   def bind_variables(self):
     return frozenset(
-        self._wrapped_regex.groupindex) | self._subpattern.bind_variables
+        self._compiled_regex.groupindex) | self._subpattern.bind_variables
 
 
 _file_matches_regex = weakref.WeakKeyDictionary()
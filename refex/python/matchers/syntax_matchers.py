@@ -103,10 +103,6 @@ High Level Syntax Matchers
 
 # pylint: disable=g-classes-have-attributes
 
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-
 import abc
 import ast
 import inspect
@@ -821,9 +817,10 @@ class WithTopLevelImport(matcher.Matcher):
 
   @classmethod
   def _get_ast_imports(cls, tree):
-    if tree not in cls._ast_imports:
-      cls._ast_imports[tree] = _top_level_imports(tree)
-    return cls._ast_imports[tree]
+    imports = cls._ast_imports.get(tree)
+    if imports is None:
+      imports = cls._ast_imports[tree] = _top_level_imports(tree)
+    return imports
 
   def _match(self, context, candidate):
     imports = self._get_ast_imports(context.parsed_file.tree)
@@ -27,6 +27,8 @@ from unittest import mock
 from absl.testing import absltest
 from absl.testing import parameterized
 from refex import cli
+from refex import formatting
+from refex import search
 
 
 class ParseArgsLeftoversTest(absltest.TestCase):
@@ -73,6 +75,18 @@ class ParseArgsLeftoversTest(absltest.TestCase):
     self.assertEqual(options.foo, 'foo')
 
 
+class ParseOptionsTest(absltest.TestCase):
+
+  def test_renderer(self):
+    """options.renderer is part of the contract for custom get_runner."""
+    parser = cli.argument_parser()
+    cli._add_rewriter_arguments(parser)
+    options = cli._parse_options(
+        ['--mode=re', '--nocolor', '--format={match}', 'x'], parser)
+    self.assertEqual(options.renderer,
+                     formatting.Renderer(match_format='{match}', color=False))
+
+
 class ExceptionTest(absltest.TestCase):
 
   def test_excepthook(self):
@@ -92,6 +106,24 @@ class ExceptionTest(absltest.TestCase):
         r' .*BUG_REPORT_URL\n')
 
 
+class RefexRunnerTest(parameterized.TestCase):
+
+  def test_rewrite_files(self):
+    files = [self.create_tempfile(content='f%d: abc' % i) for i in range(20)]
+    runner = cli.RefexRunner(
+        searcher=search.RegexSearcher.from_pattern(
+            'abc', {search.ROOT_LABEL: formatting.ShTemplate('xyz')}),
+        dry_run=False,
+        show_diff=False,
+        show_files=False,
+    )
+    failures = runner.rewrite_files(
+        [(f.full_path, f.full_path) for f in files])
+    self.assertEqual(failures, {})
+    for i, f in enumerate(files):
+      self.assertEqual(f.read_text(), 'f%d: xyz' % i)
+
+
 class MainTestBase(parameterized.TestCase):
   """Base class for tests that invoke the main function directly.
 
@@ -195,6 +227,16 @@ class MainTest(MainTestBase):
         output = sorted(output.splitlines())
         self.assertEqual(output, ['f1: xyzzy', 'f2: xyzzy', 'f3: xyzzy'])
 
+  def test_grep_many_files_in_order(self):
+    """Output is in argument order."""
+    files = [
+        self.create_tempfile(content='f%d: xyzzy' % i) for i in range(100)
+    ]
+    output = self.main(['--mode=re', 'xyzzy', '--no-filename'] +
+                       [f.full_path for f in files])
+    self.assertEqual(output.splitlines(),
+                     ['f%d: xyzzy' % i for i in range(100)])
+
   def test_grep_multi(self):
     f = self.create_tempfile(content='a\nb\n')
     self.assertEqual(
@@ -228,6 +270,12 @@ class MainTest(MainTestBase):
     ])
     self.assertEqual(output, 'xx xyzzy xx\n')
 
+  @parameterized.parameters('--also', '--noalso')
+  def test_grep_also_invalid(self, flag):
+    message = self.assert_main_error(
+        ['--mode=re', 'xyzzy', flag + '=(', os.devnull])
+    self.assertStartsWith(message, 'Failed to parse regular expression')
+
   def test_grep_noalso_match(self):
     f = self.create_tempfile(content='abc\nxx xyzzy xx')
     output = self.main(['--mode=re', 'xyzzy', '--noalso=abc', f.full_path])
@@ -393,6 +441,26 @@ class MainTest(MainTestBase):
          '--sub=%s' % replacement, '-i', f.full_path])
     self.assertEqual(f.read_text(), '')
 
+  def test_profile_to(self):
+    f = self.create_tempfile(content='abc')
+    profile_path = os.path.join(self.create_tempdir().full_path, 'profile')
+    self.main(['--mode=re', 'abc', '--profile-to', profile_path, f.full_path])
+    # The profile is written by the time main returns, not at exit.
+    self.assertTrue(os.path.exists(profile_path))
+
+  def test_sub_unchanged_not_written(self):
+    f = self.create_tempfile(content='abc')
+    os.utime(f.full_path, (0, 0))
+    _ = self.main(['--mode=re', 'abc', '--sub=abc', '-i', f.full_path])
+    self.assertEqual(os.stat(f.full_path).st_mtime, 0)
+
+  def test_sub_many_files(self):
+    files = [self.create_tempfile(content='f%d: abc' % i) for i in range(100)]
+    _ = self.main(['--mode=re', 'abc', '--sub=xyz', '-i'] +
+                  [f.full_path for f in files])
+    for i, f in enumerate(files):
+      self.assertEqual(f.read_text(), 'f%d: xyz' % i)
+
   @parameterized.parameters(
       [[]],
       [['--iterate=10', '--no-iterate']],